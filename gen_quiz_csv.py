@@ -12,25 +12,191 @@ The quiz markdown format:
 - > Correct Answer: X. explanation (blockquote format)
 - > Correct Answers: A, B, C (for multi-select)
 - Multi-select indicated by "(Select all that apply)"
-- Short answer indicated by "**Short Answer Question:**"
+- Short answer indicated by a line starting with "**Short Answer Question:**"
 - Code blocks with ``` for code snippets
 
 Usage:
     python3 gen_quiz_csv.py input.md -o output.csv
     python3 gen_quiz_csv.py input.md --no-titles -o output.csv
     python3 gen_quiz_csv.py input.md -c COURSE123 -o output.csv
+    python3 gen_quiz_csv.py --batch quizzes/ -c COURSE123
 """
 
 import argparse
-import csv
+import functools
+import glob
+import io
+import itertools
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Compiled once at import; parse_question runs these on every line of a quiz.
+_CORRECT_RE = re.compile(r"^>\s*Correct Answers?:\s*(.+)$")
+_FEEDBACK_RE = re.compile(r"^>\s*Overall Feedback:\s*(.+)$")
+_HTML_RE = re.compile(r"<[a-zA-Z][^>]*>")
+
+# Letters that may label an answer option
+_OPTION_LETTERS = "ABCDEFG"
+
+# Line prefixes that mark a question as Short Answer
+_SHORT_ANSWER_PREFIXES = ("**Short Answer Question", "Short Answer Question")
+
+# Line kind for each first character that can start a marker line; any
+# other first character means the line is plain question text. "S" and "*"
+# both route to the short answer / reference checks.
+_LINE_KINDS = {
+    "`": "fence",
+    "-": "rule",
+    "#": "header",
+    ">": "quote",
+    "*": "marker",
+    "S": "marker",
+}
+_LINE_KINDS.update(dict.fromkeys(_OPTION_LETTERS, "option"))
+
+# Italic lines that are kept in the question text without their asterisks
+_REFERENCE_PREFIXES = ("*Reference:", "*Note:")
+
+# Characters that can start a markdown token in question text
+_MARKER_RE = re.compile(r"[`*\n]")
+
+# Fenced code block: ```lang, an optional newline, then the body up to ```
+_FENCE_RE = re.compile(r"```\w*\n?(.*?)```", re.DOTALL)
+
+# Character substitutions applied to the body of fenced code blocks
+_CODE_BLOCK_TABLE = str.maketrans(
+    {
+        " ": "&nbsp;",
+        "\n": "<br>",
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+    }
+)
+
+# Output buffer for write_d2l_csv (1 MiB comfortably holds a typical quiz)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _Record:
+    """Base for the fixed-shape records produced by the parser.
+
+    Fields live in ``__slots__`` rather than a per-instance dict. Subscript
+    access, ``get()`` and ``in`` work on the field names as they did for the
+    earlier dict records.
+    """
+
+    # Slot names, option letters and type codes are all literals, so Python
+    # already interns them; no explicit sys.intern() is needed
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default=None):
+        """Return the field ``key``, or ``default`` if there is no such field."""
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Option(_Record):
+    """A single answer option (``A.`` to ``G.`` line) of a question."""
+
+    __slots__ = ("letter", "text", "correct", "html")
+
+    def __init__(self, letter: str, text: str, correct: bool, html: bool):
+        self.letter = letter
+        self.text = text
+        self.correct = correct
+        self.html = html
 
 
-def parse_question(lines: List[str], question_num: int) -> Optional[dict]:
-    """Parse a single question block into structured data."""
+class Question(_Record):
+    """A parsed quiz question, ready to be written as D2L CSV rows."""
+
+    __slots__ = (
+        "num",
+        "type",
+        "title",
+        "text",
+        "options",
+        "correct_letters",
+        "correct_explanation",
+        "short_answer",
+    )
+
+    def __init__(
+        self,
+        num: int,
+        type: str,
+        title: str,
+        text: str,
+        options: List[Option],
+        correct_letters: Tuple[str, ...],
+        correct_explanation: str,
+        short_answer: str,
+    ):
+        self.num = num
+        self.type = type
+        self.title = title
+        self.text = text
+        self.options = options
+        self.correct_letters = correct_letters
+        self.correct_explanation = correct_explanation
+        self.short_answer = short_answer
+
+    def copy(self) -> "Question":
+        """Return a copy with its own options list and Option records."""
+        return Question(
+            self.num,
+            self.type,
+            self.title,
+            self.text,
+            [Option(o.letter, o.text, o.correct, o.html) for o in self.options],
+            self.correct_letters,
+            self.correct_explanation,
+            self.short_answer,
+        )
+
+
+def parse_question(lines: Sequence[str], question_num: int) -> Optional[Question]:
+    """Parse a single question block into structured data.
+
+    The parse is cached on the block's lines and number, but every call
+    returns a fresh copy, so callers may modify the result freely.
+    clear_parse_cache() empties the cache.
+    """
+    cached = _parse_question_cached(tuple(lines), question_num)
+    return cached.copy() if cached else None
+
+
+def clear_parse_cache() -> None:
+    """Empty the cache behind parse_question."""
+    _parse_question_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_question_cached(
+    lines: Tuple[str, ...], question_num: int
+) -> Optional[Question]:
+    """Memoised parse_question; the lines are a tuple so they can be hashed."""
+    return _parse_question(lines, question_num)
+
+
+def _parse_question(lines: Sequence[str], question_num: int) -> Optional[Question]:
+    """Uncached parse_question, for callers whose blocks are never repeated."""
     if not lines:
         return None
 
@@ -44,113 +210,142 @@ def parse_question(lines: List[str], question_num: int) -> Optional[dict]:
     in_code_block = False
     code_block_content = []
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Handle code blocks
-        if stripped.startswith("```"):
-            if in_code_block:
-                in_code_block = False
-                code_block_content.append(line)
-                question_text_lines.append("\n".join(code_block_content))
-                code_block_content = []
-            else:
-                in_code_block = True
-                code_block_content = [line]
-            continue
+    # Hot-loop lookups bound to locals once, instead of per line
+    add_text = question_text_lines.append
+    match_correct = _CORRECT_RE.match
+    match_feedback = _FEEDBACK_RE.match
+    line_kinds = _LINE_KINDS.get
 
+    for line in lines:
+        # Code block lines are kept raw, so only look for the closing fence
         if in_code_block:
             code_block_content.append(line)
-            continue
-
-        # Skip separator lines but preserve empty lines for paragraph breaks
-        if stripped == "---":
+            if "```" in line and line.lstrip().startswith("```"):
+                in_code_block = False
+                # Keep the fenced lines flat; the final join adds the newlines
+                question_text_lines.extend(code_block_content)
+                code_block_content = []
             continue
 
         # Handle empty lines - preserve them as paragraph breaks
-        if not stripped:
-            question_text_lines.append("")
+        if not line or line.isspace():
+            add_text("")
             continue
 
-        # Parse question header: ## Topic or ## Topic: Subtopic
-        # Format: "## RV Continuum: World Knowledge" or "## Implementation: npm Scripts"
-        # Note: Headers are used to separate questions but titles are NOT extracted
-        # to keep the xSite short description field empty
-        header_match = re.match(r"^##\s*(.+)$", stripped)
-        if header_match:
-            # Skip the header line - don't use it as title
-            continue
+        stripped = line.strip()
+        # The first character decides which (if any) marker a line can be,
+        # so one table lookup routes the line and plain text skips the rest.
+        first = stripped[0]
+        kind = line_kinds(first)
+
+        if kind == "fence":
+            # Handle code blocks
+            if stripped.startswith("```"):
+                in_code_block = True
+                code_block_content = [line]
+                continue
 
-        # Check for short answer indicator
-        if (
-            "**Short Answer Question:**" in stripped
-            or "Short Answer Question" in stripped
-        ):
-            is_short_answer = True
-            continue
+        elif kind == "rule":
+            # Skip separator lines
+            if stripped == "---":
+                continue
 
-        # Parse correct answer line: > Correct Answer: X. text or > Correct Answers: A, B, C
-        # Feedback is on the next line: > Overall Feedback: explanation
-        correct_match = re.match(r"^>\s*Correct Answers?:\s*(.+)$", stripped)
-        if correct_match:
-            answer_text = correct_match.group(1).strip()
-            # Extract letters (A, B, C, D, etc.) - only single capital letters followed by . or ,
-            letter_match = re.findall(r"\b([A-G])(?:\.|,|\s|$)", answer_text)
-            correct_letters = letter_match if letter_match else []
+        elif kind == "header":
+            # Parse question header: ## Topic or ## Topic: Subtopic
+            # Format: "## RV Continuum: World Knowledge" or "## Implementation: npm Scripts"
+            # Note: Headers are used to separate questions but titles are NOT extracted
+            # to keep the xSite short description field empty
+            if stripped.startswith("##") and len(stripped) > 2:
+                # Skip the header line - don't use it as title
+                continue
 
-            # For short answer questions (no letters), store the answer text separately
-            if not correct_letters:
-                short_answer_text = answer_text
+        elif kind == "quote":
+            # Parse correct answer line: > Correct Answer: X. text or > Correct Answers: A, B, C
+            # Feedback is on the next line: > Overall Feedback: explanation
+            correct_match = match_correct(stripped)
+            if correct_match:
+                answer_text = correct_match.group(1).strip()
+                # Extract letters (A, B, C, D, etc.) - only single capital letters followed by . or ,
+                tokens = answer_text.replace(",", " ").split()
+                correct_letters = [
+                    t[0]
+                    for t in tokens
+                    if t[0] in _OPTION_LETTERS and (len(t) == 1 or t[1:] == ".")
+                ]
+
+                # For short answer questions (no letters), store the answer text separately
+                if not correct_letters:
+                    short_answer_text = answer_text
+
+                # Look for Overall Feedback on subsequent lines
+                continue
 
-            # Look for Overall Feedback on subsequent lines
-            continue
+            # Parse overall feedback line: > Overall Feedback: explanation
+            feedback_match = match_feedback(stripped)
+            if feedback_match:
+                # For all questions: use as feedback/explanation
+                correct_explanation = feedback_match.group(1).strip()
+                continue
 
-        # Parse overall feedback line: > Overall Feedback: explanation
-        feedback_match = re.match(r"^>\s*Overall Feedback:\s*(.+)$", stripped)
-        if feedback_match:
-            # For all questions: use as feedback/explanation
-            correct_explanation = feedback_match.group(1).strip()
-            continue
+        elif kind == "option":
+            # Parse option lines: A. option text, B. option text, etc.
+            if stripped[1:2] == "." and len(stripped) > 2:
+                text = stripped[2:].strip()
+                options.append(Option(first, text, False, _has_html(text)))
+                continue
 
-        # Parse option lines: A. option text, B. option text, etc.
-        option_match = re.match(r"^([A-G])\.\s*(.+)$", stripped)
-        if option_match:
-            letter = option_match.group(1)
-            text = option_match.group(2).strip()
-            options.append({"letter": letter, "text": text, "correct": False})
-            continue
+        elif kind == "marker":
+            # Check for short answer indicator at the start of the line
+            if stripped.startswith(_SHORT_ANSWER_PREFIXES):
+                is_short_answer = True
+                continue
 
-        # Include reference lines in question text (converted to italic)
-        if stripped.startswith("*Reference:") or stripped.startswith("*Note:"):
-            # Convert markdown italic to HTML italic
-            ref_text = stripped
-            if ref_text.startswith("*") and ref_text.endswith("*"):
-                ref_text = ref_text[
-                    1:-1
-                ]  # Remove asterisks for now, will be processed later
-            question_text_lines.append(ref_text)
-            continue
+            # Include reference lines in question text (converted to italic)
+            if first == "*" and stripped.startswith(_REFERENCE_PREFIXES):
+                # Convert markdown italic to HTML italic
+                ref_text = stripped
+                if ref_text.endswith("*"):
+                    ref_text = ref_text[
+                        1:-1
+                    ]  # Remove asterisks for now, will be processed later
+                add_text(ref_text)
+                continue
 
         # Accumulate question text
-        question_text_lines.append(line)
+        add_text(line)
 
-    # Mark correct options
+    # Mark correct options, collecting their letters in option order
+    marked = []
     for opt in options:
-        if opt["letter"] in correct_letters:
-            opt["correct"] = True
-
-    # Build question text
-    question_text = "\n".join(question_text_lines).strip()
-
-    if not question_text:
+        if opt.letter in correct_letters:
+            opt.correct = True
+            marked.append(opt.letter)
+
+    # Build question text: drop blank lines at either end before joining,
+    # then trim the outer edges of the first and last remaining lines
+    start = 0
+    end = len(question_text_lines)
+    while start < end and (
+        not question_text_lines[start] or question_text_lines[start].isspace()
+    ):
+        start += 1
+    while end > start and (
+        not question_text_lines[end - 1] or question_text_lines[end - 1].isspace()
+    ):
+        end -= 1
+
+    if start == end:
         return None
 
-    # Determine question type
-    correct_count = sum(1 for o in options if o["correct"])
+    text_lines = question_text_lines[start:end]
+    text_lines[0] = text_lines[0].lstrip()
+    text_lines[-1] = text_lines[-1].rstrip()
+    question_text = "\n".join(text_lines)
 
+    # Determine question type
     if is_short_answer or not options:
         q_type = "SA"  # Short Answer
-    elif correct_count > 1:
+    elif len(marked) > 1:
         q_type = "MS"  # Multi-Select
     else:
         q_type = "MC"  # Multiple Choice
@@ -162,196 +357,437 @@ def parse_question(lines: List[str], question_num: int) -> Optional[dict]:
         if not correct_explanation:
             correct_explanation = short_answer_text
 
-    return {
-        "num": question_num,
-        "type": q_type,
-        "title": title,
-        "text": question_text,
-        "options": options,
-        "correct_explanation": correct_explanation,
-        "short_answer": short_answer_text if q_type == "SA" else "",
-    }
+    return Question(
+        question_num,
+        q_type,
+        title,
+        question_text,
+        options,
+        tuple(marked),
+        correct_explanation,
+        short_answer_text if q_type == "SA" else "",
+    )
 
 
-def parse_quiz_file(filepath: str) -> List[dict]:
-    """Parse a quiz markdown file and extract all questions."""
-    questions = []
+def _parse_quiz_lines(lines: Iterable[str]) -> List[Question]:
+    """Split quiz lines into question blocks and parse each one.
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    lines = content.split("\n")
+    ``lines`` may be an open text file or any other iterable of lines; a
+    trailing newline on each line is ignored. Lines are consumed lazily, so
+    only the current question block is held in memory.
+    """
+    questions = []
 
-    # Split into question blocks by ## headers
+    # Split into question blocks by ## headers. Each block is parsed as soon
+    # as it ends rather than farmed out to worker processes: pickling a block
+    # and its Question costs more than parsing it, so parallelism only pays
+    # off per file (see --batch)
     current_block = []
     question_num = 0
     in_questions = False
 
     for line in lines:
-        stripped = line.strip()
-        # Headers start with "## " but not "## Learning Objectives"
-        if stripped.startswith("## ") and not stripped.startswith(
-            "## Learning Objectives"
-        ):
-            in_questions = True
-            if current_block and question_num > 0:
-                q = parse_question(current_block, question_num)
-                if q:
-                    questions.append(q)
-
-            question_num += 1
-            current_block = [line]
-        elif stripped.startswith("## Learning Objectives"):
-            if current_block and question_num > 0:
-                q = parse_question(current_block, question_num)
-                if q:
-                    questions.append(q)
+        line = line.rstrip("\n")
+        # Headers start at column 0, so most lines are rejected by one slice
+        if line[:3] != "## ":
+            if in_questions:
+                current_block.append(line)
+            continue
+
+        if current_block and question_num > 0:
+            q = _parse_question(current_block, question_num)
+            if q:
+                questions.append(q)
+
+        # "## Learning Objectives" ends the questions section
+        if line.startswith("## Learning Objectives"):
             break
-        elif in_questions:
-            current_block.append(line)
+
+        in_questions = True
+        question_num += 1
+        current_block = [line]
 
     # Handle last block if not ended by Learning Objectives
     if current_block and question_num > 0:
-        q = parse_question(current_block, question_num)
+        q = _parse_question(current_block, question_num)
         if q:
-            if not questions or questions[-1]["num"] != q["num"]:
+            if not questions or questions[-1].num != q.num:
                 questions.append(q)
 
     return questions
 
 
-def format_question_text(text: str) -> str:
-    """Convert markdown formatting to HTML for D2L."""
-    result = text
-    code_blocks = []
-
-    def replace_code_block(match):
-        code_content = match.group(1)
-        lines = code_content.split("\n")
-        processed_lines = []
-        for line in lines:
-            # Replace ALL spaces with &nbsp; to preserve indentation
-            processed_line = line.replace(" ", "&nbsp;")
-            processed_lines.append(processed_line)
-        code_with_br = "<br>".join(processed_lines)
-        # Use smaller font size (0.7em) for code blocks
-        formatted_code = f'<div style="font-family: monospace; background-color: #f4f4f4; padding: 10px; line-height: 1.4; font-size: 0.7em;">{code_with_br}</div>'
-        code_blocks.append(formatted_code)
-        return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
-
-    # Match code blocks (```...```)
-    result = re.sub(
-        r"```(?:\w+)?\n?(.*?)```", replace_code_block, result, flags=re.DOTALL
-    )
+def parse_quiz_text(content: str) -> List[Question]:
+    """Parse quiz markdown held in a string and extract all questions."""
+    # newline=None gives the same universal-newline handling as reading a file
+    return _parse_quiz_lines(io.StringIO(content, newline=None))
 
-    # Convert markdown bold **text** to HTML <strong>
-    result = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", result)
 
-    # Convert markdown italic *text* to HTML <em> (but not already processed bold)
-    result = re.sub(r"(?<!\*)\*([^*]+)\*(?!\*)", r"<em>\1</em>", result)
+def parse_quiz_file(filepath: str) -> List[Question]:
+    """Parse a quiz markdown file and extract all questions.
 
-    # Convert inline code `code` to HTML <code>
-    result = re.sub(r"`([^`]+)`", r"<code>\1</code>", result)
+    The file is streamed line by line, so memory use is bounded by the
+    largest question block rather than by the size of the file.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        return _parse_quiz_lines(f)
+
+
+def _render_code_block(code_content: str) -> str:
+    """Render the body of a fenced code block as a monospace <div>."""
+    # Replace ALL spaces with &nbsp; to preserve indentation, newlines with
+    # <br>, and escape &, < and > so code is shown rather than parsed as HTML,
+    # all in a single pass over the block
+    code_with_br = code_content.translate(_CODE_BLOCK_TABLE)
+    # Use smaller font size (0.7em) for code blocks
+    return f'<div style="font-family: monospace; background-color: #f4f4f4; padding: 10px; line-height: 1.4; font-size: 0.7em;">{code_with_br}</div>'
+
+
+def _render_markdown(
+    text: str, out: List[str], start: int = 0, end: Optional[int] = None
+) -> bool:
+    """Append the HTML for markdown ``text[start:end]`` to ``out`` in one pass.
+
+    Handles ```fenced``` blocks, **bold**, *italic*, `inline code` and
+    newlines. Bold and italic spans are rendered recursively over the same
+    string (by index, without slicing) so inline code and line breaks inside
+    them are still converted. Stars inside fenced blocks never open or close
+    a span.
+
+    Returns True if any HTML tag was emitted.
+    """
+    if end is None:
+        end = len(text)
+    emitted_html = False
+    i = start
+    # True when the text just before i was consumed by a token, so a star
+    # there has already been rendered and cannot block an italic opener
+    after_token = False
+    while i < end:
+        # Jump to the next character that can start a token
+        marker = _MARKER_RE.search(text, i, end)
+        hit = marker.start() if marker else end
+        if hit > i:
+            out.append(text[i:hit])
+            after_token = False
+        if hit == end:
+            break
 
-    # Convert newlines to <br> for non-code content
-    result = result.replace("\n", "<br>")
+        char = text[hit]
+        if char == "\n":
+            out.append("<br>")
+            emitted_html = True
+            i = hit + 1
+            after_token = False
+        elif char == "`":
+            # Fenced code block: ```lang\n ... ```. Matching it here instead
+            # of in a separate sub() pass is safe because the star searches
+            # (_find_star) treat fences as opaque, as that pass would
+            fence = _FENCE_RE.match(text, hit, end)
+            if fence:
+                out.append(_render_code_block(fence.group(1)))
+                emitted_html = True
+                i = fence.end()
+                after_token = True
+                continue
+            # Inline code: `code`, never closed by the start of a fence
+            close = text.find("`", hit + 1, end)
+            if close > hit + 1 and not text.startswith("```", close, end):
+                out.append("<code>")
+                out.append(text[hit + 1 : close].replace("\n", "<br>"))
+                out.append("</code>")
+                emitted_html = True
+                i = close + 1
+                after_token = True
+            else:
+                out.append("`")
+                i = hit + 1
+                after_token = False
+        else:
+            # Bold: **text** with no asterisks inside
+            if text.startswith("**", hit, end):
+                close = _find_star(text, hit + 2, end)
+                if close > hit + 2 and text.startswith("**", close, end):
+                    out.append("<strong>")
+                    _render_markdown(text, out, hit + 2, close)
+                    out.append("</strong>")
+                    emitted_html = True
+                    i = close + 2
+                    after_token = True
+                    continue
+
+            # Italic: *text*, which may wrap complete bold spans
+            close = _find_italic_close(text, hit + 1, end)
+            if (
+                close > hit + 1
+                and (
+                    hit == start
+                    or text[hit - 1] != "*"
+                    or (hit == i and after_token)
+                )
+                and (
+                    not text.startswith("*", close + 1, end)
+                    or _opens_bold(text, close + 1, end)
+                )
+            ):
+                out.append("<em>")
+                _render_markdown(text, out, hit + 1, close)
+                out.append("</em>")
+                emitted_html = True
+                i = close + 1
+                after_token = True
+            else:
+                out.append("*")
+                i = hit + 1
+                after_token = False
+
+    return emitted_html
+
+
+def _find_star(text: str, start: int, end: int) -> int:
+    """Return the index of the next star in ``text[start:end]``, or -1.
+
+    Stars inside ```fenced``` blocks are skipped, so an unmatched star in
+    the prose (``**kwargs``, ``2*3``) never pairs with one in the code.
+    """
+    star = text.find("*", start, end)
+    while star != -1:
+        fence = text.find("```", start, star)
+        if fence == -1:
+            return star
+        block = _FENCE_RE.match(text, fence, end)
+        if block is None:
+            # Unclosed backticks, not a fence: keep looking past them
+            start = fence + 3
+        else:
+            start = block.end()
+            if star < start:
+                star = text.find("*", start, end)
+    return star
+
+
+def _find_italic_close(text: str, start: int, end: int) -> int:
+    """Return the index of the star closing an italic span, skipping **bold** spans."""
+    close = _find_star(text, start, end)
+    while close != -1 and text.startswith("**", close, end):
+        bold_end = _find_star(text, close + 2, end)
+        if bold_end <= close + 2 or not text.startswith("**", bold_end, end):
+            break
+        close = _find_star(text, bold_end + 2, end)
+    return close
 
-    # Restore code blocks
-    for i, code_block in enumerate(code_blocks):
-        result = result.replace(f"__CODE_BLOCK_{i}__", code_block)
 
-    return result
+def _opens_bold(text: str, start: int, end: int) -> bool:
+    """Check whether a complete **bold** span starts at ``text[start]``."""
+    if not text.startswith("**", start, end):
+        return False
+    close = _find_star(text, start + 2, end)
+    return close > start + 2 and text.startswith("**", close, end)
+
+
+def _has_html(text: str) -> bool:
+    """Check whether text contains an HTML tag, skipping the regex when it can't."""
+    return "<" in text and _HTML_RE.search(text) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_question_html(text: str) -> Tuple[str, bool]:
+    """Format question text and report whether the result contains HTML tags.
+
+    Results are cached: the output depends only on the text, and the same
+    text is often formatted more than once (e.g. format_question_text in a
+    preview, then write_d2l_csv).
+    """
+    out = []
+    emitted_html = _render_markdown(text, out)
+    # With no tags emitted the output is the input text unchanged, so only
+    # raw HTML written in the markdown itself can still set the flag
+    return "".join(out), emitted_html or _has_html(text)
+
+
+def format_question_text(text: str) -> str:
+    """Convert markdown formatting to HTML for D2L."""
+    return _format_question_html(text)[0]
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field if it contains a comma, double quote, CR or LF."""
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+# D2L rows always have five fields, and most of them are fixed, so rows are
+# formatted directly as text instead of going through csv.writer.
+_HEADER_ROWS = (
+    "// Converted from quiz markdown using gen_quiz_csv.py\n"
+    "// Originally developed for SIT xSITe LMS - may require modifications for other D2L instances\n"
+    + _csv_field(
+        "// Question types: MC=Multiple Choice, MS=Multi-Select, SA=Short Answer"
+    )
+    + "\n\n"
+)
+
+# Rows that are identical for every question, built once
+_POINTS_ROW = "Points,1,,,\n"
+_DIFFICULTY_ROW = "Difficulty,2,,,\n"
+_SCORING_ROW = "Scoring,RightAnswers,,,\n"
+_INPUT_BOX_ROW = "InputBox,1,50,,\n"
+_NO_ANSWER_ROW = "Answer,100,See marking guide,,\n"
+_BLANK_ROW = "\n"
+
+
+def _question_rows(q: Question, id_prefix: str, include_titles: bool):
+    """Yield the D2L CSV rows for a single question as formatted lines.
+
+    ``id_prefix`` is the course part of the question ID (e.g. "COURSE-Q").
+    """
+    # Format question text with proper HTML conversion
+    q_text, has_html = _format_question_html(q.text)
+    html_indicator = "HTML" if has_html else ""
+
+    # Use title or blank based on include_titles flag
+    title = q.title if include_titles else ""
+
+    q_id = f"{id_prefix}{q.num:02d}"
+
+    # Write question header
+    yield f"NewQuestion,{q.type},,,\n"
+    yield f"ID,{_csv_field(q_id)},,,\n"
+    yield f"Title,{_csv_field(title)},,,\n"
+    yield f"QuestionText,{_csv_field(q_text)},{html_indicator},,\n"
+    yield _POINTS_ROW
+    yield _DIFFICULTY_ROW
+
+    # Write options/answers based on type
+    if q.type == "MC":
+        for opt in q.options:
+            score = "100" if opt.correct else "0"
+            opt_html = "HTML" if opt.html else ""
+            yield f"Option,{score},{_csv_field(opt.text)},{opt_html},\n"
+
+    elif q.type == "MS":
+        yield _SCORING_ROW
+        for opt in q.options:
+            score = "1" if opt.correct else "0"
+            opt_html = "HTML" if opt.html else ""
+            yield f"Option,{score},{_csv_field(opt.text)},{opt_html},\n"
+
+    elif q.type == "SA":
+        yield _INPUT_BOX_ROW
+        # Use short_answer field for SA questions (the actual answer text)
+        answer_text = q.short_answer
+        if answer_text:
+            yield f"Answer,100,{_csv_field(answer_text)},,\n"
+        else:
+            yield _NO_ANSWER_ROW
+
+    # Add feedback if there's an explanation
+    if q.correct_explanation and q.type != "SA":
+        yield f"Feedback,{_csv_field(q.correct_explanation)},,,\n"
+
+    # Empty line between questions
+    yield _BLANK_ROW
 
 
 def write_d2l_csv(
-    questions: List[dict],
+    questions: List[Question],
     output_path: str,
     course_code: str,
     include_titles: bool = True,
 ):
     """Write questions to D2L Brightspace CSV format."""
-
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f, lineterminator="\n")
-
-        # Write header comments
-        writer.writerow(["// Converted from quiz markdown using gen_quiz_csv.py"])
-        writer.writerow(
-            [
-                "// Originally developed for SIT xSITe LMS - may require modifications for other D2L instances"
-            ]
+    id_prefix = f"{course_code}-Q"
+
+    # A large buffer lets the whole quiz go out in a few big writes
+    # instead of one small write per CSV row
+    with open(
+        output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+    ) as f:
+        f.write(_HEADER_ROWS)
+        f.writelines(
+            itertools.chain.from_iterable(
+                _question_rows(q, id_prefix, include_titles)
+                for q in questions
+                if q.text
+            )
         )
-        writer.writerow(
-            ["// Question types: MC=Multiple Choice, MS=Multi-Select, SA=Short Answer"]
-        )
-        writer.writerow([])
 
-        for q in questions:
-            if not q["text"]:
-                continue
 
-            # Format question text with proper HTML conversion
-            q_text = format_question_text(q["text"])
-
-            # Check if question text contains HTML tags
-            html_indicator = "HTML" if re.search(r"<[a-zA-Z][^>]*>", q_text) else ""
-
-            # Use title or blank based on include_titles flag
-            title = q["title"] if include_titles else ""
-
-            # Write question header
-            writer.writerow(["NewQuestion", q["type"], "", "", ""])
-            writer.writerow(["ID", f"{course_code}-Q{q['num']:02d}", "", "", ""])
-            writer.writerow(["Title", title, "", "", ""])
-            writer.writerow(["QuestionText", q_text, html_indicator, "", ""])
-            writer.writerow(["Points", "1", "", "", ""])
-            writer.writerow(["Difficulty", "2", "", "", ""])
-
-            # Write options/answers based on type
-            if q["type"] == "MC":
-                for opt in q["options"]:
-                    score = "100" if opt["correct"] else "0"
-                    opt_html = (
-                        "HTML" if re.search(r"<[a-zA-Z][^>]*>", opt["text"]) else ""
-                    )
-                    writer.writerow(["Option", score, opt["text"], opt_html, ""])
-
-            elif q["type"] == "MS":
-                writer.writerow(["Scoring", "RightAnswers", "", "", ""])
-                for opt in q["options"]:
-                    score = "1" if opt["correct"] else "0"
-                    opt_html = (
-                        "HTML" if re.search(r"<[a-zA-Z][^>]*>", opt["text"]) else ""
-                    )
-                    writer.writerow(["Option", score, opt["text"], opt_html, ""])
-
-            elif q["type"] == "SA":
-                writer.writerow(["InputBox", "1", "50", "", ""])
-                # Use short_answer field for SA questions (the actual answer text)
-                answer_text = q.get("short_answer", "")
-                if answer_text:
-                    writer.writerow(["Answer", "100", answer_text, "", ""])
-                else:
-                    writer.writerow(["Answer", "100", "See marking guide", "", ""])
-
-            # Add feedback if there's an explanation
-            if q["correct_explanation"] and q["type"] != "SA":
-                writer.writerow(["Feedback", q["correct_explanation"], "", "", ""])
-
-            # Empty line between questions
-            writer.writerow([])
+def _batch_inputs(pattern: str) -> List[Path]:
+    """Resolve a --batch argument (a directory or a glob) to markdown files."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob("*.md"))
+    return sorted(Path(p) for p in glob.glob(pattern))
+
+
+def _convert_one(
+    input_path: Path, course_code: str, include_titles: bool
+) -> Tuple[Path, Path, int, Optional[str]]:
+    """Convert one quiz in batch mode, writing <name>-d2l.csv next to it.
+
+    Runs in a worker process, so it has to stay a module-level function.
+    Returns the input path, the output path, the number of questions and an
+    error message (None on success). Read and write errors are reported
+    rather than raised so one bad file does not abort the rest of the batch.
+    """
+    output_path = input_path.with_name(f"{input_path.stem}-d2l.csv")
+    try:
+        questions = parse_quiz_file(str(input_path))
+        if questions:
+            write_d2l_csv(questions, str(output_path), course_code, include_titles)
+    except (OSError, UnicodeDecodeError) as exc:
+        return input_path, output_path, 0, str(exc)
+    return input_path, output_path, len(questions), None
+
+
+def _run_batch(pattern: str, course_code: str, include_titles: bool) -> int:
+    """Convert every quiz matched by pattern in parallel; return an exit code."""
+    inputs = _batch_inputs(pattern)
+    if not inputs:
+        print(f"Error: No markdown files found for: {pattern}", file=sys.stderr)
+        return 1
+
+    # Each file is parsed and written independently, so one process per core
+    convert = functools.partial(
+        _convert_one, course_code=course_code, include_titles=include_titles
+    )
+    failed = 0
+    workers = min(len(inputs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for input_path, output_path, count, error in executor.map(convert, inputs):
+            if error:
+                print(f"Error: {input_path}: {error}", file=sys.stderr)
+                failed += 1
+            elif count:
+                print(f"Converted {count} questions from {input_path} to {output_path}")
+            else:
+                print(f"No questions found in {input_path}")
+                failed += 1
+
+    print(f"\nConverted {len(inputs) - failed} of {len(inputs)} quiz files")
+    return 1 if failed else 0
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Convert quiz markdown files to D2L Brightspace CSV format"
     )
-    parser.add_argument("input", help="Input markdown file (e.g., quiz01.md)")
+    parser.add_argument(
+        "input", nargs="?", help="Input markdown file (e.g., quiz01.md)"
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        metavar="PATH",
+        help="Convert every .md file in a directory (or matching a quoted glob) "
+        "in parallel, writing <name>-d2l.csv next to each input",
+    )
     parser.add_argument(
         "-o",
         "--output",
-        default="quiz-d2l.csv",
-        help="Output CSV file (default: quiz-d2l.csv)",
+        help="Output CSV file (default: quiz-d2l.csv; not allowed with --batch)",
     )
     parser.add_argument(
         "-c",
@@ -368,11 +804,27 @@ def main():
         "-v",
         "--verbose",
         action="store_true",
-        help="Print detailed parsing information",
+        help="Print detailed parsing information (not allowed with --batch)",
     )
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.input:
+            parser.error("use either an input file or --batch, not both")
+        # Batch outputs are named after each input, and per-question details
+        # from parallel workers would interleave, so reject these explicitly
+        if args.output:
+            parser.error("-o/--output cannot be used with --batch")
+        if args.verbose:
+            parser.error("-v/--verbose cannot be used with --batch")
+        sys.exit(_run_batch(args.batch, args.course, not args.no_titles))
+
+    if not args.input:
+        parser.error("an input file or --batch is required")
+    if not args.output:
+        args.output = "quiz-d2l.csv"
+
     # Check input file exists
     if not Path(args.input).exists():
         print(f"Error: Input file not found: {args.input}", file=sys.stderr)
@@ -387,10 +839,10 @@ def main():
 
     if args.verbose:
         for q in questions:
-            print(f"Q{q['num']}: {q['type']} - {q['title']}")
-            print(f"  Options: {len(q['options'])}")
-            correct = [o["letter"] for o in q["options"] if o["correct"]]
-            print(f"  Correct: {', '.join(correct) if correct else 'N/A'}")
+            print(f"Q{q.num}: {q.type} - {q.title}")
+            print(f"  Options: {len(q.options)}")
+            correct = ", ".join(q.correct_letters)
+            print(f"  Correct: {correct or 'N/A'}")
             print()
 
     # Write output
@@ -401,7 +853,7 @@ def main():
     # Summary by type
     types = {}
     for q in questions:
-        types[q["type"]] = types.get(q["type"], 0) + 1
+        types[q.type] = types.get(q.type, 0) + 1
 
     print("\nQuestion types:")
     for t, count in sorted(types.items()):
@@ -2,6 +2,9 @@
 """
 Simple test runner that works without external dependencies.
 
+If the optional ``concurrencytest`` package is installed, tests are spread
+across forked worker processes (one per CPU); otherwise they run serially.
+
 Usage:
     python3 run_tests.py          # Run all tests
     python3 run_tests.py -v       # Run with verbose output
@@ -11,6 +14,11 @@ import sys
 import os
 import unittest
 
+try:
+    from concurrencytest import ConcurrentTestSuite, fork_for_tests
+except ImportError:
+    ConcurrentTestSuite = None
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -21,6 +29,10 @@ def run_tests():
     start_dir = "tests"
     suite = loader.discover(start_dir, pattern="test_*.py")
 
+    # Shard tests across processes when concurrencytest is available
+    if ConcurrentTestSuite is not None and hasattr(os, "fork"):
+        suite = ConcurrentTestSuite(suite, fork_for_tests(os.cpu_count() or 1))
+
     # Check for verbosity flag
     verbosity = 2 if "-v" in sys.argv or "--verbose" in sys.argv else 1
 
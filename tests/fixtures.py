@@ -2,11 +2,12 @@
 Test fixtures and sample data for the test suite.
 
 This module provides reusable test data following the DRY principle
-(Don't Repeat Yourself).
+(Don't Repeat Yourself). Question fixtures are tuples so they can be shared
+safely between tests without being copied.
 """
 
 # Sample multiple choice question
-SAMPLE_MC_QUESTION = [
+SAMPLE_MC_QUESTION = (
     "## Variables: Assignment",
     "What is the value of x after: x = 5",
     "",
@@ -19,10 +20,10 @@ SAMPLE_MC_QUESTION = [
     "",
     "> Correct Answer: B. 5",
     "> Overall Feedback: The variable x is assigned the value 5.",
-]
+)
 
 # Sample multi-select question
-SAMPLE_MS_QUESTION = [
+SAMPLE_MS_QUESTION = (
     "## Data Types: Collections",
     "Which are valid Python data types?",
     "",
@@ -35,10 +36,10 @@ SAMPLE_MS_QUESTION = [
     "",
     "> Correct Answers: A, B, D",
     "> Overall Feedback: list, dict, and tuple are built-in. array requires import.",
-]
+)
 
 # Sample short answer question
-SAMPLE_SA_QUESTION = [
+SAMPLE_SA_QUESTION = (
     "## Functions: Keywords",
     "**Short Answer Question:**",
     "",
@@ -46,10 +47,10 @@ SAMPLE_SA_QUESTION = [
     "",
     "> Correct Answer: def",
     "> Overall Feedback: The def keyword is used to define functions in Python.",
-]
+)
 
 # Sample question with code block
-SAMPLE_CODE_QUESTION = [
+SAMPLE_CODE_QUESTION = (
     "## Code: Output",
     "What does this code print?",
     "",
@@ -65,7 +66,63 @@ SAMPLE_CODE_QUESTION = [
     "",
     "> Correct Answer: B. 10",
     "> Overall Feedback: The code assigns 10 to x and prints it.",
-]
+)
+
+# Sample question with no options (parsed as short answer)
+SAMPLE_NO_OPTIONS_QUESTION = ("## Incomplete Question", "This question has no options.")
+
+# Sample question with quotes and HTML-like characters
+SAMPLE_SPECIAL_CHARS_QUESTION = (
+    "## Special: Characters",
+    "What about quotes? \"test\" and 'test'",
+    "",
+    "A. Option with <special> chars",
+    "B. Option with & ampersand",
+    "",
+    "> Correct Answer: A. Option with <special> chars",
+    "> Overall Feedback: Special chars should be preserved.",
+)
+
+# Sample question with non-ASCII characters
+SAMPLE_UNICODE_QUESTION = (
+    "## Unicode: Support",
+    "What is π (pi) approximately?",
+    "",
+    "A. 3.14",
+    "B. 2.71",
+    "",
+    "> Correct Answer: A. 3.14",
+    "> Overall Feedback: π ≈ 3.14159...",
+)
+
+# Sample multi-select question with options A-F
+SAMPLE_MANY_OPTIONS_QUESTION = (
+    "## Many: Options",
+    "Which are valid?",
+    "",
+    "A. First",
+    "B. Second",
+    "C. Third",
+    "D. Fourth",
+    "E. Fifth",
+    "F. Sixth",
+    "",
+    "> Correct Answers: A, C, E",
+    "> Overall Feedback: Every other option is correct.",
+)
+
+# Sample question whose fields need CSV quoting
+SAMPLE_CSV_QUOTING_QUESTION = (
+    "## Quoting: Fields",
+    "Which value, if any, is \"quoted\"?",
+    "",
+    "A. Plain",
+    "B. With, comma",
+    "C. Carriage\rreturn",
+    "",
+    "> Correct Answer: B. With, comma",
+    '> Overall Feedback: Commas and "quotes" must be escaped.',
+)
 
 # Complete sample quiz file content
 SAMPLE_QUIZ_CONTENT = """# Sample Quiz (3 Questions)
@@ -117,13 +174,18 @@ C. Option 3
 | 3 | Multi-Select |
 """
 
+# SAMPLE_QUIZ_CONTENT split once into lines, for tests that work line by line
+SAMPLE_QUIZ_LINES = tuple(SAMPLE_QUIZ_CONTENT.split("\n"))
+
 # Expected results for validation
 EXPECTED_MC_RESULTS = {
     "type": "MC",
     "num": 1,
     "title": "",  # titles intentionally left blank since af50c48
-    "correct_letter": "B",
+    "correct_letters": ["B"],
     "option_count": 4,
+    "short_answer": "",
+    "correct_explanation": "The variable x is assigned the value 5.",
 }
 
 EXPECTED_MS_RESULTS = {
@@ -132,12 +194,16 @@ EXPECTED_MS_RESULTS = {
     "title": "",  # titles intentionally left blank since af50c48
     "correct_letters": ["A", "B", "D"],
     "option_count": 4,
+    "short_answer": "",
+    "correct_explanation": "list, dict, and tuple are built-in. array requires import.",
 }
 
 EXPECTED_SA_RESULTS = {
     "type": "SA",
     "num": 3,
     "title": "",  # titles intentionally left blank since af50c48
-    "short_answer": "def",
+    "correct_letters": [],
     "option_count": 0,
+    "short_answer": "def",
+    "correct_explanation": "The def keyword is used to define functions in Python.",
 }